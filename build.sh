@@ -48,6 +48,8 @@ pyinstaller \
     --hidden-import=google.genai.types \
     --hidden-import=google.genai.errors \
     --add-data "src/config.py:." \
+    --add-data "src/jsonutil.py:." \
+    --add-data "src/protocol.py:." \
     --add-data "src/state.py:." \
     --add-data "src/daemon.py:." \
     --add-data "src/client.py:." \
@@ -5,16 +5,114 @@ Communicates with daemon via Unix socket
 Handles clipboard read/write
 """
 
-import argparse
-import json
 import os
+import select
 import socket
+import struct
 import subprocess
 import sys
 import time
 from pathlib import Path
+from typing import Optional
+
+import jsonutil
+import protocol
+from config import Config, PromptStore
+
+# Built once, the clipboard helpers run on every keybind press
+WL_PASTE_ARGV = ("wl-paste",)
+WL_COPY_ARGV = ("wl-copy",)
+
+# struct timeval for SO_RCVTIMEO/SO_SNDTIMEO (30 seconds)
+DAEMON_TIMEOUT = struct.pack("ll", 30, 0)
+
+
+def run_clipboard_command(
+    argv, input_data: Optional[bytes] = None, timeout: float = 5
+) -> Optional[bytes]:
+    """Run wl-paste/wl-copy waiting on a pidfd, return stdout or None on failure"""
+    reading = input_data is None
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL if reading else subprocess.PIPE,
+        stdout=subprocess.PIPE if reading else subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
-from config import Config
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        # No pidfd support (Linux < 5.3), let subprocess do the waiting
+        try:
+            output, _ = proc.communicate(input_data, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return None
+        return (output or b"") if proc.returncode == 0 else None
+
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        if reading:
+            stdout_fd = proc.stdout.fileno()
+            poller.register(stdout_fd, select.POLLIN)
+
+        # Input is fed as the pipe drains, a child that never reads it can't
+        # block us past the deadline
+        writing = not reading
+        if writing:
+            stdin_fd = proc.stdin.fileno()
+            os.set_blocking(stdin_fd, False)
+            poller.register(stdin_fd, select.POLLOUT)
+            pending = memoryview(input_data)
+
+        # Sleep until the child exits and its output is drained, no polling
+        chunks = []
+        exited = False
+        deadline = time.monotonic() + timeout
+        while not exited or reading or writing:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                return None
+
+            for fd, _ in poller.poll(remaining * 1000):
+                if fd == pidfd:
+                    exited = True
+                    poller.unregister(pidfd)
+                    continue
+
+                if writing and fd == stdin_fd:
+                    try:
+                        pending = pending[os.write(stdin_fd, pending) :]
+                    except BlockingIOError:
+                        continue
+                    except BrokenPipeError:
+                        # The child went away before taking all of its input
+                        proc.wait()
+                        return None
+                    if not pending:
+                        writing = False
+                        poller.unregister(stdin_fd)
+                        proc.stdin.close()
+                    continue
+
+                chunk = os.read(stdout_fd, 65536)
+                if chunk:
+                    chunks.append(chunk)
+                else:
+                    reading = False
+                    poller.unregister(stdout_fd)
+
+        return b"".join(chunks) if proc.wait() == 0 else None
+    finally:
+        os.close(pidfd)
+        if proc.stdout:
+            proc.stdout.close()
+        if proc.stdin:
+            proc.stdin.close()
 
 
 class ClipboardAIClient:
@@ -22,40 +120,58 @@ class ClipboardAIClient:
 
     def __init__(self):
         self.config = Config()
-        self.socket_path = f"/tmp/clipboard-ai-{os.getuid()}.sock"
+        self.socket_path = protocol.SOCKET_PATH
+        self._daemon_alive = False
 
     def get_clipboard(self) -> str:
         """Get clipboard content using wl-paste"""
         try:
-            result = subprocess.run(
-                ["wl-paste"], capture_output=True, text=True, check=True, timeout=5
-            )
-            return result.stdout
-        except subprocess.CalledProcessError:
-            return ""
-        except subprocess.TimeoutExpired:
-            return ""
+            output = run_clipboard_command(WL_PASTE_ARGV)
         except FileNotFoundError:
             self.set_clipboard(
                 "Error: wl-paste not found. Install wl-clipboard package."
             )
             return ""
 
+        if output is None:
+            return ""
+        return output.decode("utf-8", errors="replace")
+
     def set_clipboard(self, text: str) -> bool:
         """Set clipboard content using wl-copy"""
         try:
-            subprocess.run(["wl-copy"], input=text, text=True, check=True, timeout=5)
-            return True
-        except (
-            subprocess.CalledProcessError,
-            subprocess.TimeoutExpired,
-            FileNotFoundError,
-        ):
+            return run_clipboard_command(WL_COPY_ARGV, text.encode("utf-8")) is not None
+        except FileNotFoundError:
             return False
 
+    async def _start_daemon_and_read_clipboard(self) -> tuple[bool, str]:
+        """Start the daemon and read the clipboard concurrently"""
+        import asyncio
+
+        # Both block in their own thread, the clipboard read is the same one
+        # the warm path uses
+        started, content = await asyncio.gather(
+            asyncio.to_thread(self.start_daemon), asyncio.to_thread(self.get_clipboard)
+        )
+        return started, content
+
     def is_daemon_running(self) -> bool:
-        """Check if daemon is running"""
-        return os.path.exists(self.socket_path)
+        """Check if daemon is accepting connections (a stale socket file is not enough)"""
+        if self._daemon_alive:
+            return True
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(0.05)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
+        # Remember for the rest of this invocation
+        self._daemon_alive = True
+        return True
 
     def start_daemon(self) -> bool:
         """Start the daemon if not running"""
@@ -73,11 +189,15 @@ class ClipboardAIClient:
                 start_new_session=True,
             )
 
-            # Wait for daemon to start (max 5 seconds)
-            for _ in range(50):
+            # Wait for daemon to start (max 5 seconds), polling quickly at
+            # first and backing off so a ready daemon is noticed right away
+            delay = 0.005
+            deadline = time.monotonic() + 5.0
+            while time.monotonic() < deadline:
                 if self.is_daemon_running():
                     return True
-                time.sleep(0.1)
+                time.sleep(delay)
+                delay = min(delay * 1.7, 0.2)
 
             return False
         except Exception as e:
@@ -89,27 +209,51 @@ class ClipboardAIClient:
         try:
             # Connect to daemon
             sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(30)  # 30 second timeout
+            # Timeouts enforced by the kernel on the blocking calls themselves,
+            # settimeout() would wrap every call in a poll()
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, DAEMON_TIMEOUT)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, DAEMON_TIMEOUT)
             sock.connect(self.socket_path)
 
-            # Send request
-            request = {"action": action, "content": content}
-            sock.sendall(json.dumps(request).encode("utf-8"))
+            # Send request, large clipboards go through shared memory
+            payload = content.encode("utf-8")
+            if action == "send" and len(payload) > protocol.SHARED_THRESHOLD:
+                protocol.send_shared(sock, payload)
+            else:
+                protocol.send_frame(sock, protocol.ACTION_CODES[action], payload)
 
             # Receive response
-            response_data = sock.recv(8192).decode("utf-8")
-            response = json.loads(response_data)
+            _, response_data = protocol.recv_frame(sock)
+            response = jsonutil.loads(response_data)
 
             sock.close()
             return response
 
-        except socket.timeout:
+        except BlockingIOError:
+            # EAGAIN from an expired SO_RCVTIMEO/SO_SNDTIMEO
             return {"status": "error", "message": "Request timed out"}
         except ConnectionRefusedError:
             return {"status": "error", "message": "Daemon not responding"}
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
+    def has_recent_state(self) -> bool:
+        """Check if the saved conversation exists and hasn't timed out yet"""
+        try:
+            mtime = os.stat(self.config.CURRENT_STATE).st_mtime
+        except FileNotFoundError:
+            return False
+
+        # Recent turns may only be in the message log
+        try:
+            mtime = max(mtime, os.stat(self.config.MESSAGE_LOG).st_mtime)
+        except FileNotFoundError:
+            pass
+
+        # peek, a status check must not set up the config directory
+        timeout_hours = self.config.peek("conversation_timeout_hours", 12)
+        return time.time() - mtime <= timeout_hours * 3600
+
     def handle_send(self) -> int:
         """Handle normal send action (read clipboard, send to AI, write response)"""
         # Check API key
@@ -119,19 +263,29 @@ class ClipboardAIClient:
             )
             return 1
 
-        # Start daemon if needed
-        if not self.start_daemon():
-            self.set_clipboard("Error: Failed to start daemon")
-            return 1
+        if self.is_daemon_running():
+            # Let the daemon use the selection it is already watching
+            response = self.send_to_daemon("send_current")
+            content = None
+        else:
+            # Cold start: read the clipboard while the daemon comes up
+            import asyncio
 
-        # Read clipboard
-        content = self.get_clipboard()
-        if not content:
-            self.set_clipboard("Error: Clipboard is empty")
-            return 1
+            started, content = asyncio.run(self._start_daemon_and_read_clipboard())
+            if not started:
+                self.set_clipboard("Error: Failed to start daemon")
+                return 1
+            response = {"status": "unavailable"}
 
-        # Send to daemon
-        response = self.send_to_daemon("send", content)
+        if response["status"] == "unavailable":
+            # No clipboard watcher in the daemon, read clipboard ourselves
+            if content is None:
+                content = self.get_clipboard()
+            if not content:
+                self.set_clipboard("Error: Clipboard is empty")
+                return 1
+
+            response = self.send_to_daemon("send", content)
 
         if response["status"] == "success":
             # Write response to clipboard
@@ -159,6 +313,11 @@ class ClipboardAIClient:
             print("No active daemon running")
             return 0
 
+        # Only ask the daemon when the state file could hold a live conversation
+        if not self.has_recent_state():
+            print("No active conversation")
+            return 0
+
         response = self.send_to_daemon("status")
 
         if response["status"] == "success":
@@ -167,15 +326,19 @@ class ClipboardAIClient:
             if not status["active"]:
                 print(status["message"])
             else:
-                print(f"Active conversation:")
-                print(f"  Prompt: {status['prompt_name']}")
-                print(f"  Model: {status['model']}")
-                print(f"  Started: {status['created_at']}")
-                print(f"  Last activity: {status['last_activity']}")
-                print(f"  Messages: {status['message_count']}")
+                # Build the whole report and write it once
+                lines = [
+                    "Active conversation:",
+                    f"  Prompt: {status['prompt_name']}",
+                    f"  Model: {status['model']}",
+                    f"  Started: {status['created_at']}",
+                    f"  Last activity: {status['last_activity']}",
+                    f"  Messages: {status['message_count']}",
+                ]
                 if "timeout_hours" in status:
-                    print(f"  Timeout: {status['timeout_hours']} hours")
-                print(f"\nArchived conversations: {status['history_count']}")
+                    lines.append(f"  Timeout: {status['timeout_hours']} hours")
+                lines.append(f"\nArchived conversations: {status['history_count']}")
+                sys.stdout.write("\n".join(lines) + "\n")
 
             return 0
         else:
@@ -184,31 +347,34 @@ class ClipboardAIClient:
 
     def handle_list_prompts(self) -> int:
         """Handle --list-prompts flag (show available prompts)"""
-        prompts = self.config.get_all_prompts()
+        # Prompts only, config.json isn't needed for the listing
+        prompts = PromptStore().get_all_prompts()
 
         if not prompts:
             print("No prompts configured")
             return 0
 
-        print("Available prompts:")
+        # Build the whole listing and write it once
+        lines = ["Available prompts:"]
         for name, prompt_config in prompts.items():
             model = prompt_config.get("model", "unknown")
             temp = prompt_config.get("temperature", 0.7)
             thinking = "On" if prompt_config.get("thinking_enabled", False) else "Off"
 
-            print(f"\n  {name}")
-            print(f"    Model: {model} | Temp: {temp} | Thinking: {thinking}")
+            lines.append(f"\n  {name}")
+            lines.append(f"    Model: {model} | Temp: {temp} | Thinking: {thinking}")
 
         # Show current status
         if self.is_daemon_running():
-            print()
+            lines.append("")
             response = self.send_to_daemon("status")
             if response["status"] == "success" and response["data"]["active"]:
                 status = response["data"]
-                print(f"Current conversation: {status['prompt_name']}")
-                print(f"  Started: {status['created_at']}")
-                print(f"  Messages: {status['message_count']}")
+                lines.append(f"Current conversation: {status['prompt_name']}")
+                lines.append(f"  Started: {status['created_at']}")
+                lines.append(f"  Messages: {status['message_count']}")
 
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
 
     def handle_setup(self) -> int:
@@ -255,7 +421,26 @@ class ClipboardAIClient:
             return 1
 
 
+# Single flag invocations that map straight to a handler
+FAST_FLAGS = {
+    "--new": ClipboardAIClient.handle_new,
+    "--status": ClipboardAIClient.handle_status,
+    "--list-prompts": ClipboardAIClient.handle_list_prompts,
+    "--setup": ClipboardAIClient.handle_setup,
+    "--reset": ClipboardAIClient.handle_reset,
+}
+
+
 def main():
+    # Keybind invocations skip importing argparse and building the parser
+    argv = sys.argv[1:]
+    if not argv:
+        return ClipboardAIClient().handle_send()
+    if len(argv) == 1 and argv[0] in FAST_FLAGS:
+        return FAST_FLAGS[argv[0]](ClipboardAIClient())
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Clipboard AI - AI assistant through clipboard",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -281,7 +466,7 @@ def main():
     client = ClipboardAIClient()
 
     # Enable debug mode if requested
-    if args.debug:
+    if args.debug and not client.config.get("debug"):
         client.config.set("debug", True)
 
     # Handle different actions
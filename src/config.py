@@ -4,35 +4,18 @@ Configuration management for clipboard-ai
 Handles config files, directory structure, and prompt loading
 """
 
-import json
 import os
 from pathlib import Path
 from typing import Dict, Optional, Any
 
+import jsonutil
 
-class Config:
-    """Manages clipboard-ai configuration"""
 
-    # Default paths
+class PromptStore:
+    """Loads prompt configurations, without touching config.json"""
+
     CONFIG_DIR = Path.home() / ".config" / "clipboard-ai"
-    CONFIG_FILE = CONFIG_DIR / "config.json"
     PROMPTS_DIR = CONFIG_DIR / "prompts"
-    STATE_DIR = CONFIG_DIR / "state"
-    HISTORY_DIR = STATE_DIR / "history"
-    CURRENT_STATE = STATE_DIR / "current.json"
-    DEBUG_LOG = CONFIG_DIR / "debug.log"
-
-    # Default configuration
-    DEFAULT_CONFIG = {
-        "api_key": "",
-        "default_prompt": "default",
-        "default_model": "gemini-2.5-flash",
-        "conversation_timeout_hours": 12,
-        "thinking_enabled": False,
-        "debug": False,
-        "max_retries": 3,
-        "retry_delay_seconds": 2,
-    }
 
     # Default prompt
     DEFAULT_PROMPT = {
@@ -60,77 +43,38 @@ Respond with ONLY: 'Ready. Paste your query.'""",
     }
 
     def __init__(self):
-        self.config: Dict[str, Any] = {}
-        self._ensure_structure()
-        self.load()
+        self._prompts_ready = False
 
-    def _ensure_structure(self):
-        """Create config directory structure if it doesn't exist"""
-        self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    def _ensure_prompts(self):
+        """Create the prompts directory and default prompt on first use"""
+        self._prompts_ready = True
         self.PROMPTS_DIR.mkdir(parents=True, exist_ok=True)
-        self.STATE_DIR.mkdir(parents=True, exist_ok=True)
-        self.HISTORY_DIR.mkdir(parents=True, exist_ok=True)
 
         # Create default prompt if it doesn't exist
         default_prompt_file = self.PROMPTS_DIR / "default.json"
         if not default_prompt_file.exists():
             self._save_json(default_prompt_file, self.DEFAULT_PROMPT)
 
-    def load(self) -> Dict[str, Any]:
-        """Load configuration from file, create if doesn't exist"""
-        if not self.CONFIG_FILE.exists():
-            # First run - create default config
-            self.config = self.DEFAULT_CONFIG.copy()
-            self.save()
-            return self.config
-
-        try:
-            with open(self.CONFIG_FILE, "r") as f:
-                loaded = json.load(f)
-                # Merge with defaults to handle new config keys
-                self.config = {**self.DEFAULT_CONFIG, **loaded}
-                return self.config
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading config: {e}")
-            # Fall back to defaults
-            self.config = self.DEFAULT_CONFIG.copy()
-            return self.config
-
-    def save(self):
-        """Save current configuration to file"""
-        self._save_json(self.CONFIG_FILE, self.config)
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value"""
-        return self.config.get(key, default)
-
-    def set(self, key: str, value: Any):
-        """Set configuration value and save"""
-        self.config[key] = value
-        self.save()
-
-    def is_configured(self) -> bool:
-        """Check if API key is configured"""
-        return bool(self.config.get("api_key"))
-
     def load_prompt(self, prompt_name: str) -> Optional[Dict[str, Any]]:
         """Load a prompt configuration by name"""
+        if not self._prompts_ready:
+            self._ensure_prompts()
+
         prompt_file = self.PROMPTS_DIR / f"{prompt_name}.json"
 
         if not prompt_file.exists():
             return None
 
         try:
-            with open(prompt_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            return jsonutil.loads(prompt_file.read_bytes())
+        except (jsonutil.JSONDecodeError, IOError) as e:
             print(f"Error loading prompt '{prompt_name}': {e}")
             return None
 
     def list_prompts(self) -> list[str]:
         """List all available prompt names"""
-        if not self.PROMPTS_DIR.exists():
-            return []
+        if not self._prompts_ready:
+            self._ensure_prompts()
 
         prompts = []
         for file in self.PROMPTS_DIR.glob("*.json"):
@@ -140,9 +84,28 @@ Respond with ONLY: 'Ready. Paste your query.'""",
 
     def get_all_prompts(self) -> Dict[str, Dict[str, Any]]:
         """Load all prompts with their configurations"""
+        if not self._prompts_ready:
+            self._ensure_prompts()
+
+        # Single directory pass, DirEntry already knows the file type
         prompts = {}
-        for prompt_name in self.list_prompts():
-            prompt_config = self.load_prompt(prompt_name)
+        try:
+            with os.scandir(self.PROMPTS_DIR) as it:
+                entries = sorted(
+                    (e for e in it if e.name.endswith(".json") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except FileNotFoundError:
+            return prompts
+
+        for entry in entries:
+            prompt_name = entry.name[: -len(".json")]
+            try:
+                prompt_config = jsonutil.loads(Path(entry.path).read_bytes())
+            except (jsonutil.JSONDecodeError, IOError) as e:
+                print(f"Error loading prompt '{prompt_name}': {e}")
+                continue
+
             if prompt_config:
                 prompts[prompt_name] = prompt_config
         return prompts
@@ -178,13 +141,134 @@ Respond with ONLY: 'Ready. Paste your query.'""",
 
     @staticmethod
     def _save_json(filepath: Path, data: Dict):
-        """Save JSON data to file"""
+        """Save JSON data to file (atomically, a crash never leaves it half written)"""
         try:
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
+            jsonutil.write_atomic(filepath, jsonutil.dumps_pretty(data))
         except IOError as e:
             print(f"Error saving to {filepath}: {e}")
 
+
+class Config(PromptStore):
+    """Manages clipboard-ai configuration"""
+
+    # Default paths
+    CONFIG_DIR = PromptStore.CONFIG_DIR
+    CONFIG_FILE = CONFIG_DIR / "config.json"
+    STATE_DIR = CONFIG_DIR / "state"
+    HISTORY_DIR = STATE_DIR / "history"
+    CURRENT_STATE = STATE_DIR / "current.json"
+    MESSAGE_LOG = STATE_DIR / "messages.jsonl"
+    DEBUG_LOG = CONFIG_DIR / "debug.log"
+
+    # Default configuration
+    DEFAULT_CONFIG = {
+        "api_key": "",
+        "default_prompt": "default",
+        "default_model": "gemini-2.5-flash",
+        "conversation_timeout_hours": 12,
+        "thinking_enabled": False,
+        "debug": False,
+        "max_retries": 3,
+        "retry_delay_seconds": 2,
+    }
+
+    def __init__(self):
+        super().__init__()
+        # Nothing touches the filesystem until a value or prompt is needed
+        self.config: Dict[str, Any] = self.DEFAULT_CONFIG.copy()
+        self._loaded = False
+
+    def _load_once(self):
+        """Set up the directory structure and load config on first use"""
+        self._loaded = True
+        self._ensure_structure()
+        self.load()
+
+    def _ensure_structure(self):
+        """Create config directory structure if it doesn't exist"""
+        self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        self.STATE_DIR.mkdir(parents=True, exist_ok=True)
+        self.HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+
+        if not self._prompts_ready:
+            self._ensure_prompts()
+
+    def load(self) -> Dict[str, Any]:
+        """Load configuration from file, create if doesn't exist"""
+        if not self.CONFIG_FILE.exists():
+            # First run - create default config
+            self.config = self.DEFAULT_CONFIG.copy()
+            self.save()
+            return self.config
+
+        try:
+            loaded = jsonutil.loads(self.CONFIG_FILE.read_bytes())
+            # Merge with defaults to handle new config keys
+            self.config = {**self.DEFAULT_CONFIG, **loaded}
+            return self.config
+        except (jsonutil.JSONDecodeError, IOError) as e:
+            print(f"Error loading config: {e}")
+            # Fall back to defaults
+            self.config = self.DEFAULT_CONFIG.copy()
+            return self.config
+
+    def save(self):
+        """Save current configuration to file"""
+        self._save_json(self.CONFIG_FILE, self.config)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get configuration value"""
+        if not self._loaded:
+            self._load_once()
+
+        return self.config.get(key, default)
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Get configuration value without creating any files or directories"""
+        if self._loaded:
+            return self.config.get(key, default)
+
+        try:
+            loaded = jsonutil.loads(self.CONFIG_FILE.read_bytes())
+        except (jsonutil.JSONDecodeError, IOError):
+            loaded = {}
+        return loaded.get(key, self.config.get(key, default))
+
+    def set(self, key: str, value: Any):
+        """Set configuration value and save"""
+        if not self._loaded:
+            self._load_once()
+
+        # Unchanged values don't need a rewrite of config.json
+        if key in self.config and self.config[key] == value:
+            return
+
+        self.config[key] = value
+        self.save()
+
+    def update(self, values: Dict[str, Any]):
+        """Set several configuration values with a single save"""
+        if not self._loaded:
+            self._load_once()
+
+        changed = {
+            key: value
+            for key, value in values.items()
+            if key not in self.config or self.config[key] != value
+        }
+        if not changed:
+            return
+
+        self.config.update(changed)
+        self.save()
+
+    def is_configured(self) -> bool:
+        """Check if API key is configured"""
+        if not self._loaded:
+            self._load_once()
+
+        return bool(self.config.get("api_key"))
+
     def __repr__(self):
         return f"Config(api_key={'set' if self.is_configured() else 'not set'}, prompts={len(self.list_prompts())})"
 
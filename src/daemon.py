@@ -4,23 +4,52 @@ Daemon for clipboard-ai
 Runs in background, maintains chat state, handles socket communication
 """
 
-import json
+import functools
 import os
+import selectors
 import signal
 import socket
+import subprocess
 import sys
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 from google import genai
 from google.genai import types, errors
 
+import jsonutil
+import protocol
 from config import Config
 from state import StateManager, ConversationState, Message
 
+# wl-paste runs the command once per new selection; terminating each selection
+# with a NUL lets the daemon split the stream on its end of the pipe
+WL_PASTE_WATCH_ARGV = [
+    "wl-paste",
+    "--no-newline",
+    "--type",
+    "text",
+    "--watch",
+    "sh",
+    "-c",
+    'cat; printf "\\0"',
+]
+
+# A watcher that exits is restarted after 1s, doubling up to this many seconds
+WATCHER_RESTART_MAX_DELAY = 300
+
+# A selection the watcher reported less than this many seconds ago may be
+# followed by one it hasn't delivered yet, the client reads those itself
+CLIPBOARD_SETTLE = 0.5
+
+# Longest single wait in the main loop. epoll takes its timeout in int
+# milliseconds, so a long conversation_timeout_hours would overflow it
+MAX_SELECT_TIMEOUT = 3600
+
 
 class ClipboardAIDaemon:
     """Main daemon that manages AI chat and socket communication"""
@@ -30,8 +59,9 @@ class ClipboardAIDaemon:
         self.state_manager = StateManager(self.config.CONFIG_DIR)
 
         # Socket setup
-        self.socket_path = f"/tmp/clipboard-ai-{os.getuid()}.sock"
-        self.socket = None
+        self.socket_path = protocol.SOCKET_PATH
+        self.sockets: List[socket.socket] = []
+        self.socket_activated = False
         self.running = False
 
         # AI client and chat
@@ -39,12 +69,45 @@ class ClipboardAIDaemon:
         self.chat = None
         self.current_state: Optional[ConversationState] = None
 
+        # Lowercased prompt names, rescanned when the prompts directory changes
+        self._prompt_names: frozenset = frozenset()
+        self._prompts_mtime: Optional[int] = None
+
+        # Clipboard watcher (None until the first selection arrives)
+        self.clipboard_process: Optional[subprocess.Popen] = None
+        self.clipboard: Optional[str] = None
+        self.clipboard_pending = b""
+        self.clipboard_changed_at = 0.0
+        self.watcher_restart_at: Optional[float] = None
+        self.watcher_restart_delay = 1.0
+
+        # Multiplexes the listening socket and the clipboard watcher pipe
+        self.selector = selectors.DefaultSelector()
+
+        # Requests run on workers so a slow Gemini call never blocks accept();
+        # the lock serializes everything that touches the chat or its state
+        # (reentrant, the signal handler may run while the main thread holds it)
+        self.pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="client")
+        self.lock = threading.RLock()
+
+        # Per-worker receive buffer, inline payloads never exceed the
+        # shared memory threshold so one allocation serves every request
+        self.recv_buffers = threading.local()
+
         # Timeout tracking
-        self.last_activity = datetime.now()
+        self.last_activity_ts = time.time()
         self.timeout_hours = self.config.get("conversation_timeout_hours", 12)
 
-        # Debug mode
+        # Retry policy and default model, read once for the daemon's lifetime
+        self.default_model = self.config.get("default_model")
+        self.max_retries = int(self.config.get("max_retries", 3))
+        retry_delay = float(self.config.get("retry_delay_seconds", 2))
+        self.rate_limit_delays = [retry_delay * (2**a) for a in range(self.max_retries)]
+        self.server_error_delay = retry_delay
+
+        # Debug mode (the log file is opened once, in run)
         self.debug = self.config.get("debug", False)
+        self._log_fd: Optional[int] = None
 
     def log(self, message: str, level: str = "INFO"):
         """Log message if debug mode is enabled"""
@@ -52,11 +115,12 @@ class ClipboardAIDaemon:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             log_entry = f"[{timestamp}] {level}: {message}\n"
 
-            try:
-                with open(self.config.DEBUG_LOG, "a") as f:
-                    f.write(log_entry)
-            except IOError:
-                pass
+            # O_APPEND makes each write atomic, workers need no lock
+            if self._log_fd is not None:
+                try:
+                    os.write(self._log_fd, log_entry.encode("utf-8"))
+                except OSError:
+                    pass
 
             # Also print to console in debug mode
             print(log_entry.strip())
@@ -77,8 +141,14 @@ class ClipboardAIDaemon:
             self.log(f"Failed to initialize API client: {e}", "ERROR")
             return False
 
-    def create_chat(self, model: str, temperature: float, thinking_enabled: bool):
-        """Create a new chat instance"""
+    def create_chat(
+        self,
+        model: str,
+        temperature: float,
+        thinking_enabled: bool,
+        history: Optional[list] = None,
+    ):
+        """Create a new chat instance, optionally seeded with earlier turns"""
         try:
             config = types.GenerateContentConfig(
                 temperature=temperature,
@@ -87,7 +157,9 @@ class ClipboardAIDaemon:
                 ),
             )
 
-            self.chat = self.client.chats.create(model=model, config=config)
+            self.chat = self.client.chats.create(
+                model=model, config=config, history=history
+            )
             self.log(
                 f"Created chat with model={model}, temp={temperature}, thinking={thinking_enabled}"
             )
@@ -108,7 +180,7 @@ class ClipboardAIDaemon:
             prompt_config = self.config.load_prompt("default")
 
         # Extract configuration
-        model = prompt_config.get("model", self.config.get("default_model"))
+        model = prompt_config.get("model", self.default_model)
         temperature = prompt_config.get("temperature", 0.7)
         thinking_enabled = prompt_config.get("thinking_enabled", False)
         first_message = prompt_config.get("first_message", "")
@@ -127,12 +199,13 @@ class ClipboardAIDaemon:
             response_text = response.text
 
             # Store in conversation history
-            self.current_state.add_message("user", first_message)
-            self.current_state.add_message("model", response_text)
+            now = time.time()
+            self.current_state.add_message("user", first_message, now)
+            self.current_state.add_message("model", response_text, now)
 
             # Save state
             self.state_manager.save_current(self.current_state)
-            self.last_activity = datetime.now()
+            self.last_activity_ts = now
 
             self.log(f"Conversation initialized, response: {len(response_text)} chars")
             return response_text
@@ -153,8 +226,7 @@ class ClipboardAIDaemon:
         self.log(f"Sending message ({len(content)} chars)")
 
         # Retry logic with exponential backoff
-        max_retries = self.config.get("max_retries", 3)
-        retry_delay = self.config.get("retry_delay_seconds", 2)
+        max_retries = self.max_retries
 
         for attempt in range(max_retries):
             try:
@@ -162,12 +234,17 @@ class ClipboardAIDaemon:
                 response_text = response.text
 
                 # Store in conversation history
-                self.current_state.add_message("user", content)
-                self.current_state.add_message("model", response_text)
+                now = time.time()
+                user_message = self.current_state.add_message("user", content, now)
+                model_message = self.current_state.add_message(
+                    "model", response_text, now
+                )
 
-                # Save state
-                self.state_manager.save_current(self.current_state)
-                self.last_activity = datetime.now()
+                # Append to the message log (snapshots current.json periodically)
+                self.state_manager.append_messages(
+                    self.current_state, user_message, model_message
+                )
+                self.last_activity_ts = now
 
                 self.log(
                     f"Message sent successfully, response: {len(response_text)} chars"
@@ -176,7 +253,7 @@ class ClipboardAIDaemon:
 
             except errors.ResourceExhausted:
                 if attempt < max_retries - 1:
-                    delay = retry_delay * (2**attempt)
+                    delay = self.rate_limit_delays[attempt]
                     self.log(
                         f"Rate limit hit, retrying in {delay}s (attempt {attempt + 1}/{max_retries})",
                         "WARN",
@@ -191,7 +268,7 @@ class ClipboardAIDaemon:
                         f"Server error, retrying (attempt {attempt + 1}/{max_retries})",
                         "WARN",
                     )
-                    time.sleep(retry_delay)
+                    time.sleep(self.server_error_delay)
                 else:
                     return "Error: Server error after retries"
 
@@ -234,72 +311,129 @@ class ClipboardAIDaemon:
         temperature = prompt_config.get("temperature", 0.7)
         thinking_enabled = prompt_config.get("thinking_enabled", False)
 
+        # Rebuild conversation context locally from the stored turns, no API calls
+        history = [
+            types.Content(role=role, parts=[types.Part(text=content)])
+            for role, content in zip(state.roles, state.contents)
+        ]
+        self.log(f"Restoring {len(history)} messages as chat history")
+
         # Create chat
-        if not self.create_chat(model, temperature, thinking_enabled):
+        if not self.create_chat(model, temperature, thinking_enabled, history):
             return False
 
-        # Rebuild conversation history by replaying messages
-        self.log(f"Replaying {len(state.messages)} messages to rebuild context")
-        for msg in state.messages:
-            try:
-                if msg.role == "user":
-                    # Send message but don't store response (it's already in history)
-                    self.chat.send_message(msg.content)
-            except Exception as e:
-                self.log(f"Error replaying message: {e}", "ERROR")
-                return False
-
         self.current_state = state
-        self.last_activity = datetime.now()
+        self.last_activity_ts = time.time()
         self.log("Conversation resumed successfully")
         return True
 
+    def available_prompts(self) -> frozenset:
+        """Get the lowercased prompt names, rescanning only after a change"""
+        try:
+            mtime = self.config.PROMPTS_DIR.stat().st_mtime_ns
+        except FileNotFoundError:
+            # list_prompts creates it, the next call picks up its mtime
+            mtime = None
+
+        if mtime is None or mtime != self._prompts_mtime:
+            self._prompt_names = frozenset(
+                p.lower() for p in self.config.list_prompts()
+            )
+            self._prompts_mtime = mtime
+        return self._prompt_names
+
+    def handle_send(self, content: str) -> str:
+        """Send content to the current conversation, starting one if needed"""
+        with self.lock:
+            if self.current_state:
+                # Continue existing conversation
+                return self.send_message(content)
+
+            # Check if content matches a prompt name
+            content_clean = content.strip().lower()
+
+            if content_clean in self.available_prompts():
+                # Start new conversation with this prompt
+                return self.start_new_conversation(content_clean)
+
+            # Start with default prompt, then send this as first message
+            result = self.start_new_conversation("default")
+            # After initialization, send the actual content
+            if not result.startswith("Error:"):
+                result = self.send_message(content)
+            return result
+
     def handle_client(self, client_socket):
         """Handle incoming client request"""
+        fds = []
         try:
-            # Receive data
-            data = client_socket.recv(4096).decode("utf-8")
-            if not data:
+            # Only serve processes of the user running the daemon
+            pid, uid, _ = protocol.peer_credentials(client_socket)
+            if uid != os.getuid():
+                self.log(f"Rejected connection from pid {pid} (uid {uid})", "WARN")
                 return
 
-            request = json.loads(data)
-            action = request.get("action")
+            # Receive request
+            try:
+                frame_type, payload, fds = protocol.recv_request(
+                    client_socket, self.recv_buffer()
+                )
+            except EOFError:
+                return
+
+            action = protocol.ACTION_NAMES.get(frame_type)
 
             self.log(f"Received action: {action}")
 
             response = {"status": "error", "message": "Unknown action"}
 
             if action == "send":
-                content = request.get("content", "")
-
-                # Check if we need to start a new conversation
-                if not self.current_state:
-                    # Check if content matches a prompt name
-                    content_clean = content.strip().lower()
-                    available_prompts = [p.lower() for p in self.config.list_prompts()]
-
-                    if content_clean in available_prompts:
-                        # Start new conversation with this prompt
-                        result = self.start_new_conversation(content_clean)
-                    else:
-                        # Start with default prompt, then send this as first message
-                        result = self.start_new_conversation("default")
-                        # After initialization, send the actual content
-                        if not result.startswith("Error:"):
-                            result = self.send_message(content)
+                content = str(payload, "utf-8")
+                response = {"status": "success", "message": self.handle_send(content)}
+
+            elif action == "send_shared" and fds:
+                content = protocol.read_shared(fds, payload)
+                response = {"status": "success", "message": self.handle_send(content)}
+
+            elif action == "send_current":
+                # Use the selection tracked by the clipboard watcher. It only
+                # learns of a copy after wl-paste has streamed it, so a copy
+                # made right before this request and not yet reported can't be
+                # told apart from an unchanged clipboard (see the README).
+                # Selections still arriving or just delivered are left to the
+                # client's one-shot read
+                changing = (
+                    self.clipboard_pending
+                    or time.monotonic() - self.clipboard_changed_at < CLIPBOARD_SETTLE
+                )
+                content = self.clipboard
+
+                if content is None:
+                    response = {
+                        "status": "unavailable",
+                        "message": "Clipboard watcher not running",
+                    }
+                elif changing:
+                    response = {
+                        "status": "unavailable",
+                        "message": "Clipboard is changing",
+                    }
+                elif not content:
+                    response = {"status": "error", "message": "Clipboard is empty"}
                 else:
-                    # Continue existing conversation
-                    result = self.send_message(content)
-
-                response = {"status": "success", "message": result}
+                    response = {
+                        "status": "success",
+                        "message": self.handle_send(content),
+                    }
 
             elif action == "new":
                 # Force new conversation
                 self.log("Forcing new conversation")
-                if self.current_state:
-                    self.state_manager.archive_current()
-                self.current_state = None
-                self.chat = None
+                with self.lock:
+                    if self.current_state:
+                        self.state_manager.archive_current()
+                    self.current_state = None
+                    self.chat = None
                 response = {
                     "status": "success",
                     "message": "Conversation reset. Next message will start fresh.",
@@ -315,41 +449,161 @@ class ClipboardAIDaemon:
                 response = {"status": "success", "message": "pong"}
 
             # Send response
-            client_socket.sendall(json.dumps(response).encode("utf-8"))
+            self.send_response(client_socket, response)
 
-        except json.JSONDecodeError:
-            error_response = {"status": "error", "message": "Invalid JSON"}
-            client_socket.sendall(json.dumps(error_response).encode("utf-8"))
+        except UnicodeDecodeError:
+            error_response = {"status": "error", "message": "Invalid UTF-8 content"}
+            self.send_response(client_socket, error_response)
         except Exception as e:
             self.log(f"Error handling client: {e}", "ERROR")
             error_response = {"status": "error", "message": str(e)}
-            client_socket.sendall(json.dumps(error_response).encode("utf-8"))
+            self.send_response(client_socket, error_response)
         finally:
+            for fd in fds:
+                os.close(fd)
             client_socket.close()
 
+    def recv_buffer(self) -> bytearray:
+        """Get the calling worker's request buffer, allocating it on first use"""
+        buf = getattr(self.recv_buffers, "buf", None)
+        if buf is None:
+            buf = self.recv_buffers.buf = bytearray(protocol.SHARED_THRESHOLD)
+        return buf
+
+    @staticmethod
+    def send_response(client_socket, response: dict):
+        """Send a response frame to the client"""
+        # dumps returns UTF-8 bytes, sent as is with the header in one sendmsg
+        protocol.send_frame(client_socket, protocol.RESPONSE, jsonutil.dumps(response))
+
+    def seconds_until_timeout(self) -> float:
+        """Get how long the main loop may sleep before the idle timeout is due"""
+        timeout_seconds = self.timeout_hours * 3600
+        if not self.current_state:
+            # Nothing to expire yet, look again after a full timeout period
+            return timeout_seconds
+
+        idle_seconds = time.time() - self.last_activity_ts
+        return max(0.0, timeout_seconds - idle_seconds)
+
     def check_timeout(self):
         """Check if daemon should shut down due to inactivity"""
-        if self.current_state:
-            idle_time = datetime.now() - self.last_activity
-            if idle_time > timedelta(hours=self.timeout_hours):
-                self.log(f"Timeout reached ({self.timeout_hours}h), shutting down")
-                self.state_manager.archive_current()
-                self.shutdown()
-
-    def timeout_checker_thread(self):
-        """Background thread to check for timeouts"""
-        while self.running:
-            time.sleep(60)  # Check every minute
-            self.check_timeout()
+        # Lock-free fast path, a worker may hold the lock for a whole API call
+        if self.seconds_until_timeout() > 0:
+            return
+
+        # A worker mid-request will refresh the activity time anyway, try again
+        # on the next pass rather than stall accept() behind its API call
+        if not self.lock.acquire(blocking=False):
+            return
+
+        try:
+            if not self.current_state or self.seconds_until_timeout() > 0:
+                return
+
+            self.log(f"Timeout reached ({self.timeout_hours}h), shutting down")
+            # Cleared first so a signal landing mid-archive can't snapshot it back
+            self.current_state = None
+            self.state_manager.archive_current()
+        finally:
+            self.lock.release()
+
+        self.shutdown()
+
+    def start_clipboard_watcher(self) -> bool:
+        """Keep a wl-paste --watch child that streams every new selection"""
+        if not os.environ.get("WAYLAND_DISPLAY"):
+            self.log("No Wayland display, clipboard watcher disabled", "WARN")
+            return False
+
+        try:
+            self.clipboard_process = subprocess.Popen(
+                WL_PASTE_WATCH_ARGV,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            self.log(f"Failed to start clipboard watcher: {e}", "WARN")
+            return False
+
+        self.selector.register(
+            self.clipboard_process.stdout, selectors.EVENT_READ, self.read_clipboard
+        )
+        self.log("Clipboard watcher started")
+        return True
+
+    def read_clipboard(self):
+        """Drain the watcher pipe, keeping the latest selection in memory"""
+        stdout = self.clipboard_process.stdout
+        chunk = os.read(stdout.fileno(), 65536)
+
+        if not chunk:
+            # wl-paste exited (compositor gone), clients must read the clipboard
+            # until it is back
+            self.log("Clipboard watcher exited", "WARN")
+            self.selector.unregister(stdout)
+            stdout.close()
+            self.clipboard_process.wait()
+            self.clipboard_process = None
+            self.clipboard = None
+            self.clipboard_pending = b""
+            self.schedule_watcher_restart()
+            return
+
+        self.clipboard_changed_at = time.monotonic()
+        self.clipboard_pending += chunk
+        if b"\0" not in self.clipboard_pending:
+            return
+
+        # Only the most recent complete selection matters
+        *selections, self.clipboard_pending = self.clipboard_pending.split(b"\0")
+        self.clipboard = selections[-1].decode("utf-8", errors="replace")
+
+        # The watcher works, a later exit starts backing off from scratch
+        self.watcher_restart_delay = 1.0
+
+    def schedule_watcher_restart(self):
+        """Arrange for the main loop to restart the watcher after a backoff"""
+        delay = self.watcher_restart_delay
+        self.watcher_restart_at = time.monotonic() + delay
+        self.watcher_restart_delay = min(delay * 2, WATCHER_RESTART_MAX_DELAY)
+        self.log(f"Restarting clipboard watcher in {delay:.0f}s")
+
+    def restart_clipboard_watcher(self):
+        """Restart the watcher once its backoff has passed"""
+        if self.watcher_restart_at is None:
+            return
+        if time.monotonic() < self.watcher_restart_at:
+            return
+
+        self.watcher_restart_at = None
+        if not self.start_clipboard_watcher():
+            self.schedule_watcher_restart()
+
+    def accept_client(self, listener: socket.socket):
+        """Accept every pending connection and hand it to a worker"""
+        while True:
+            try:
+                client_socket, _ = listener.accept()
+            except BlockingIOError:
+                return
+            # Accepted sockets are blocking even though the listener isn't
+            self.pool.submit(self.handle_client, client_socket)
 
     def setup_socket(self) -> bool:
         """Set up Unix domain socket (supports systemd socket activation)"""
         # Check for systemd socket activation
         sd_listen_fds = os.environ.get("LISTEN_FDS")
         if sd_listen_fds and int(sd_listen_fds) > 0:
-            # Use socket passed by systemd
-            self.log("Using systemd socket activation")
-            self.socket = socket.fromfd(3, socket.AF_UNIX, socket.SOCK_STREAM)
+            # Adopt the already-listening sockets passed by systemd (fds 3..)
+            count = int(sd_listen_fds)
+            self.log(f"Using systemd socket activation ({count} sockets)")
+            for fd in range(3, 3 + count):
+                listener = socket.socket(fileno=fd)
+                listener.setblocking(False)
+                self.sockets.append(listener)
+            self.socket_activated = True
             return True
 
         # Manual socket creation (for non-systemd usage)
@@ -361,9 +615,11 @@ class ClipboardAIDaemon:
                 pass
 
         try:
-            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.socket.bind(self.socket_path)
-            self.socket.listen(5)
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            listener.bind(self.socket_path)
+            listener.listen(128)
+            listener.setblocking(False)
+            self.sockets.append(listener)
             self.log(f"Socket listening at {self.socket_path}")
             return True
         except Exception as e:
@@ -375,19 +631,52 @@ class ClipboardAIDaemon:
         self.log("Shutting down daemon")
         self.running = False
 
-        if self.socket:
-            self.socket.close()
+        # Compact the message log into a final snapshot. A worker holding the
+        # lock may be between add_message and append_messages, so the snapshot
+        # is skipped then and the log replay covers the unsnapshotted turns
+        if self.lock.acquire(blocking=False):
+            try:
+                if self.current_state:
+                    self.state_manager.save_current(self.current_state)
+            finally:
+                self.lock.release()
 
-        if os.path.exists(self.socket_path):
+        if self.clipboard_process:
+            self.clipboard_process.terminate()
+
+        # Let an in-flight request finish, drop queued ones
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+        for listener in self.sockets:
+            listener.close()
+
+        # The socket file belongs to systemd when it was passed in
+        if not self.socket_activated and os.path.exists(self.socket_path):
             try:
                 os.unlink(self.socket_path)
             except OSError:
                 pass
 
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
         sys.exit(0)
 
+    def open_log(self):
+        """Open the debug log for appending, one write per line from then on"""
+        try:
+            self._log_fd = os.open(
+                self.config.DEBUG_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        except OSError as e:
+            print(f"Failed to open debug log: {e}")
+
     def run(self):
         """Main daemon loop"""
+        if self.debug:
+            self.open_log()
+
         self.log("Starting clipboard-ai daemon")
 
         # Initialize API
@@ -402,24 +691,41 @@ class ClipboardAIDaemon:
         if not self.setup_socket():
             return 1
 
+        for listener in self.sockets:
+            self.selector.register(
+                listener,
+                selectors.EVENT_READ,
+                functools.partial(self.accept_client, listener),
+            )
+
+        # Track the clipboard so clients don't have to spawn wl-paste
+        self.start_clipboard_watcher()
+
         # Set up signal handlers
         signal.signal(signal.SIGINT, self.shutdown)
         signal.signal(signal.SIGTERM, self.shutdown)
 
-        # Start timeout checker thread
         self.running = True
-        timeout_thread = threading.Thread(
-            target=self.timeout_checker_thread, daemon=True
-        )
-        timeout_thread.start()
 
         self.log("Daemon ready, waiting for connections")
 
         # Main loop
         try:
             while self.running:
-                client_socket, _ = self.socket.accept()
-                self.handle_client(client_socket)
+                # Sleeps until a connection, a clipboard change or the exact
+                # moment the idle timeout is due; activity only pushes the
+                # deadline later, so waking early just rechecks. Once it is due
+                # but a worker holds the lock, recheck each second, not in a spin
+                timeout = max(self.seconds_until_timeout(), 1.0)
+                timeout = min(timeout, MAX_SELECT_TIMEOUT)
+                if self.watcher_restart_at is not None:
+                    restart_in = self.watcher_restart_at - time.monotonic()
+                    timeout = min(timeout, max(restart_in, 0.0))
+
+                for key, _ in self.selector.select(timeout=timeout):
+                    key.data()
+                self.restart_clipboard_watcher()
+                self.check_timeout()
         except KeyboardInterrupt:
             self.shutdown()
 
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+JSON encoding for clipboard-ai
+Uses orjson when it is installed, falls back to the standard library
+"""
+
+import json
+import os
+import stat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch either way
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+
+    def dumps(data) -> bytes:
+        """Encode data as compact UTF-8 JSON"""
+        return orjson.dumps(data)
+
+    def dumps_pretty(data) -> bytes:
+        """Encode data as indented UTF-8 JSON (for files people edit)"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+
+else:
+
+    def dumps(data) -> bytes:
+        """Encode data as compact UTF-8 JSON"""
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    def dumps_pretty(data) -> bytes:
+        """Encode data as indented UTF-8 JSON (for files people edit)"""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def loads(data):
+        """Decode JSON from str, bytes or any bytes-like buffer"""
+        if not isinstance(data, (str, bytes, bytearray)):
+            data = bytes(data)
+        return json.loads(data)
+
+
+def write_atomic(filepath, payload: bytes):
+    """Write payload to a temp file and rename it over filepath
+
+    The temp file gets the mode of the file it replaces (0600 for new files),
+    so a private file like config.json, which holds the API key, stays private.
+    No fsync: a crash can lose the last writeback interval but never leaves a
+    torn file.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+
+    tmp = f"{filepath}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "wb") as f:
+        # A temp file left over from a crash keeps its old mode, set it here
+        os.fchmod(fd, mode)
+        f.write(payload)
+    os.replace(tmp, filepath)
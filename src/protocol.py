@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Wire protocol for clipboard-ai
+Length-prefixed binary frames exchanged over the daemon's Unix socket
+"""
+
+import fcntl
+import mmap
+import os
+import socket
+import struct
+from typing import List, Optional, Tuple, Union
+
+# Per-user socket the daemon listens on (systemd: /tmp/clipboard-ai-%U.sock)
+SOCKET_PATH = f"/tmp/clipboard-ai-{os.getuid()}.sock"
+
+# Frame layout: Length (4 bytes, big-endian) | Type (1 byte) | Payload
+HEADER = struct.Struct(">IB")
+
+# Request types (the payload of a send request is the raw UTF-8 content)
+ACTION_SEND = 0
+ACTION_NEW = 1
+ACTION_STATUS = 2
+ACTION_PING = 3
+ACTION_SEND_CURRENT = 4
+ACTION_SEND_SHARED = 5
+
+# Send payloads above this size are passed as a memfd instead of inline
+SHARED_THRESHOLD = 64 * 1024
+SHARED_SIZE = struct.Struct(">Q")
+
+# Seals on the memfd: once sent, the client can no longer resize or write it,
+# so the daemon's mapping can't be truncated under it (SIGBUS)
+SHARED_SEALS = fcntl.F_SEAL_SHRINK | fcntl.F_SEAL_GROW | fcntl.F_SEAL_WRITE
+
+# Response frames carry a JSON encoded dict
+RESPONSE = 0x80
+
+# struct ucred from SO_PEERCRED: pid, uid, gid
+PEER_CREDENTIALS = struct.Struct("3i")
+
+ACTION_CODES = {
+    "send": ACTION_SEND,
+    "new": ACTION_NEW,
+    "status": ACTION_STATUS,
+    "ping": ACTION_PING,
+    "send_current": ACTION_SEND_CURRENT,
+    "send_shared": ACTION_SEND_SHARED,
+}
+ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+
+
+def send_frame(sock, frame_type: int, payload: bytes = b""):
+    """Send a single frame, header and payload gathered in one sendmsg"""
+    header = HEADER.pack(len(payload), frame_type)
+    sent = sock.sendmsg([header, payload])
+
+    # Payloads larger than the socket buffer may go out in several writes
+    if sent < len(header):
+        sock.sendall(header[sent:])
+        sent = len(header)
+    if sent - len(header) < len(payload):
+        sock.sendall(memoryview(payload)[sent - len(header) :])
+
+
+def recv_frame(sock) -> Tuple[int, bytearray]:
+    """Receive a single frame, return (type, payload)"""
+    length, frame_type = HEADER.unpack(recv_exact(sock, HEADER.size))
+    return frame_type, recv_exact(sock, length)
+
+
+def recv_request(
+    sock, buf: Optional[bytearray] = None
+) -> Tuple[int, Union[bytearray, memoryview], List[int]]:
+    """Receive a single frame along with any file descriptors sent with it
+
+    When buf is given and the payload fits, the payload is read into it and
+    returned as a view, valid until buf is reused for the next request.
+    """
+    header, fds, _, _ = socket.recv_fds(sock, HEADER.size, 1)
+    if not header:
+        raise EOFError("Connection closed before request")
+    if len(header) < HEADER.size:
+        header += recv_exact(sock, HEADER.size - len(header))
+
+    length, frame_type = HEADER.unpack(header)
+    if buf is None or length > len(buf):
+        return frame_type, recv_exact(sock, length), fds
+
+    view = memoryview(buf)[:length]
+    recv_exact_into(sock, view)
+    return frame_type, view, fds
+
+
+def peer_credentials(sock) -> Tuple[int, int, int]:
+    """Get (pid, uid, gid) of the process on the other end of the socket"""
+    creds = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, PEER_CREDENTIALS.size
+    )
+    return PEER_CREDENTIALS.unpack(creds)
+
+
+def send_shared(sock, data: bytes):
+    """Send data through an anonymous memfd so it never crosses the socket"""
+    fd = os.memfd_create("clipboard-ai", os.MFD_CLOEXEC | os.MFD_ALLOW_SEALING)
+    try:
+        os.ftruncate(fd, len(data))
+        with mmap.mmap(fd, len(data)) as mm:
+            mm[:] = data
+        # The writable mapping is gone, so F_SEAL_WRITE can be applied
+        fcntl.fcntl(fd, fcntl.F_ADD_SEALS, SHARED_SEALS | fcntl.F_SEAL_SEAL)
+
+        payload = SHARED_SIZE.pack(len(data))
+        frame = HEADER.pack(len(payload), ACTION_SEND_SHARED) + payload
+        socket.send_fds(sock, [frame], [fd])
+    finally:
+        # The kernel keeps the memfd alive while it is in flight
+        os.close(fd)
+
+
+def read_shared(fds: List[int], payload: bytearray) -> str:
+    """Decode content passed by send_shared straight from the mapping"""
+    (size,) = SHARED_SIZE.unpack(payload)
+
+    # An unsealed or short memfd could shrink while mapped and kill the daemon
+    seals = fcntl.fcntl(fds[0], fcntl.F_GET_SEALS)
+    if seals & SHARED_SEALS != SHARED_SEALS:
+        raise ValueError("Shared memory is not sealed")
+    if os.fstat(fds[0]).st_size < size:
+        raise ValueError("Shared memory is smaller than announced")
+
+    with mmap.mmap(fds[0], size, prot=mmap.PROT_READ) as mm:
+        return str(mm, "utf-8")
+
+
+def recv_exact(sock, length: int) -> bytearray:
+    """Receive exactly length bytes, raise EOFError if the peer hangs up"""
+    buf = bytearray(length)
+    recv_exact_into(sock, memoryview(buf))
+
+    # Returned as is, decoders read the bytearray without another copy
+    return buf
+
+
+def recv_exact_into(sock, view: memoryview):
+    """Fill view from the socket, raise EOFError if the peer hangs up"""
+    received = 0
+
+    while received < len(view):
+        n = sock.recv_into(view[received:])
+        if not n:
+            raise EOFError("Connection closed mid-frame")
+        received += n
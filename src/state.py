@@ -4,34 +4,51 @@ State management for clipboard-ai
 Handles conversation state, message history, and archiving
 """
 
-import json
-from datetime import datetime, timedelta
+import os
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Union
+from dataclasses import dataclass, field
 
+import jsonutil
 
-@dataclass
+
+def to_epoch(timestamp: Union[float, str]) -> float:
+    """Convert a stored timestamp to epoch seconds (older files use ISO strings)"""
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp).timestamp()
+    return timestamp
+
+
+@dataclass(slots=True)
 class Message:
     """Represents a single message in the conversation"""
 
     role: str  # "user" or "model"
     content: str
-    timestamp: str = None
+    timestamp: float = 0.0  # epoch seconds
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+        if not self.timestamp:
+            self.timestamp = time.time()
 
-    def to_dict(self) -> Dict[str, str]:
-        return asdict(self)
+    def to_dict(self) -> Dict[str, Any]:
+        # Plain literal, asdict would deepcopy every (immutable) field
+        return {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.timestamp,
+        }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, str]) -> "Message":
-        return cls(**data)
+    def from_dict(cls, data: Dict[str, Any]) -> "Message":
+        message = cls(**data)
+        message.timestamp = to_epoch(message.timestamp)
+        return message
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationState:
     """Represents the current conversation state"""
 
@@ -39,8 +56,13 @@ class ConversationState:
     prompt_name: str
     model: str
     created_at: str
-    last_activity: str
-    messages: List[Message]
+    # Epoch seconds of the last message, what the timeout checks compare against
+    last_activity_ts: float = 0.0
+    # Messages stored column-wise: index i of each list is the i-th message.
+    # Saving hands these lists to the encoder as is, nothing is rebuilt per turn
+    roles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    timestamps: List[float] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -49,44 +71,102 @@ class ConversationState:
             "model": self.model,
             "created_at": self.created_at,
             "last_activity": self.last_activity,
-            "messages": [msg.to_dict() for msg in self.messages],
+            "last_activity_ts": self.last_activity_ts,
+            "roles": self.roles,
+            "contents": self.contents,
+            "timestamps": self.timestamps,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ConversationState":
-        messages = [Message.from_dict(msg) for msg in data.get("messages", [])]
-        return cls(
+        # Files written before last_activity_ts existed only have the string
+        last_activity_ts = data.get("last_activity_ts")
+        if last_activity_ts is None:
+            last_activity_ts = to_epoch(
+                data.get("last_activity", datetime.now().isoformat())
+            )
+
+        state = cls(
             active=data.get("active", True),
             prompt_name=data.get("prompt_name", "default"),
             model=data.get("model", "gemini-2.5-flash"),
             created_at=data.get("created_at", datetime.now().isoformat()),
-            last_activity=data.get("last_activity", datetime.now().isoformat()),
-            messages=messages,
+            last_activity_ts=last_activity_ts,
+            roles=data.get("roles", []),
+            contents=data.get("contents", []),
+            timestamps=[to_epoch(t) for t in data.get("timestamps", [])],
         )
 
-    def add_message(self, role: str, content: str):
-        """Add a message to the conversation"""
-        self.messages.append(Message(role=role, content=content))
-        self.last_activity = datetime.now().isoformat()
+        # Older files store a list of message dicts
+        for msg in data.get("messages", []):
+            state.append_message(Message.from_dict(msg))
+        return state
+
+    @property
+    def last_activity(self) -> str:
+        """Last activity as an ISO string, for people reading the state files"""
+        return datetime.fromtimestamp(self.last_activity_ts).isoformat()
+
+    @property
+    def messages(self) -> List[Message]:
+        """Messages as Message objects, built on demand"""
+        return [
+            Message(role=role, content=content, timestamp=timestamp)
+            for role, content, timestamp in zip(
+                self.roles, self.contents, self.timestamps
+            )
+        ]
+
+    def add_message(
+        self, role: str, content: str, now: Optional[float] = None
+    ) -> Message:
+        """Add a message to the conversation
+
+        now is the epoch time to record, callers adding a whole turn pass the
+        same value for both messages instead of reading the clock twice.
+        """
+        if now is None:
+            now = time.time()
+        message = Message(role=role, content=content, timestamp=now)
+        self.append_message(message)
+        self.last_activity_ts = now
+        return message
+
+    def append_message(self, message: Message):
+        """Append an existing message (e.g. one replayed from the log)"""
+        self.roles.append(message.role)
+        self.contents.append(message.content)
+        self.timestamps.append(message.timestamp)
 
     def is_expired(self, timeout_hours: int) -> bool:
         """Check if conversation has expired based on timeout"""
-        last_activity = datetime.fromisoformat(self.last_activity)
-        timeout = timedelta(hours=timeout_hours)
-        return datetime.now() - last_activity > timeout
+        return time.time() - self.last_activity_ts > timeout_hours * 3600
 
     def get_message_count(self) -> int:
         """Get total number of messages in conversation"""
-        return len(self.messages)
+        return len(self.roles)
 
 
 class StateManager:
     """Manages conversation state persistence"""
 
+    # Messages are appended to messages.jsonl as they arrive, current.json is
+    # a full snapshot rewritten every SNAPSHOT_INTERVAL turns (and on archive
+    # or shutdown) that records how much of the log it already covers
+    SNAPSHOT_INTERVAL = 10
+
     def __init__(self, config_dir: Path):
         self.state_dir = config_dir / "state"
         self.history_dir = self.state_dir / "history"
         self.current_state_file = self.state_dir / "current.json"
+        self.message_log_file = self.state_dir / "messages.jsonl"
+
+        # Append handle for the message log, opened on first write
+        self._message_log = None
+        self._turns_since_snapshot = 0
+        # End of the last complete turn when the log has a torn tail, the log
+        # is cut back to it before anything else is appended
+        self._log_end: Optional[int] = None
 
         # Ensure directories exist
         self.state_dir.mkdir(parents=True, exist_ok=True)
@@ -98,33 +178,139 @@ class StateManager:
             return None
 
         try:
-            with open(self.current_state_file, "r") as f:
-                data = json.load(f)
-                return ConversationState.from_dict(data)
-        except (json.JSONDecodeError, IOError) as e:
+            data = jsonutil.loads(self.current_state_file.read_bytes())
+            state = ConversationState.from_dict(data)
+        except (jsonutil.JSONDecodeError, IOError) as e:
             print(f"Error loading state: {e}")
             return None
 
+        # Snapshots without an offset predate the message log
+        if "log_offset" in data:
+            self._replay_log(state, data["log_offset"])
+        return state
+
+    def _replay_log(self, state: ConversationState, offset: int):
+        """Add messages logged after the snapshot was taken"""
+        # Turns are logged as a user line then a model line, only whole turns
+        # count so the restored history keeps alternating
+        turn = []
+        end = offset
+        try:
+            with open(self.message_log_file, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        message = Message.from_dict(jsonutil.loads(line))
+                    except (jsonutil.JSONDecodeError, TypeError):
+                        # Torn write from a crash, nothing after it is usable
+                        break
+                    turn.append(message)
+                    if message.role == "model":
+                        for logged in turn:
+                            state.append_message(logged)
+                        turn = []
+                        end = f.tell()
+                size = f.seek(0, os.SEEK_END)
+        except FileNotFoundError:
+            return
+        except IOError as e:
+            print(f"Error reading message log: {e}")
+            return
+
+        if end < size and self._message_log is None:
+            self._log_end = end
+
+        # The newest logged message is the last activity
+        if state.timestamps:
+            state.last_activity_ts = state.timestamps[-1]
+
     def save_current(self, state: ConversationState):
-        """Save current conversation state"""
+        """Save a full snapshot of the current conversation state"""
+        data = state.to_dict()
+        data["log_offset"] = self._log_size()
+
         try:
-            with open(self.current_state_file, "w") as f:
-                json.dump(state.to_dict(), f, indent=2)
+            self._write_atomic(self.current_state_file, data)
+            self._turns_since_snapshot = 0
         except IOError as e:
             print(f"Error saving state: {e}")
 
+    def append_messages(self, state: ConversationState, *messages: Message):
+        """Append one turn's messages to the log, snapshotting periodically"""
+        lines = b"".join(
+            jsonutil.dumps(message.to_dict()) + b"\n" for message in messages
+        )
+
+        try:
+            if self._message_log is None:
+                self._open_log()
+            self._message_log.write(lines)
+            self._message_log.flush()
+        except IOError as e:
+            print(f"Error appending to message log: {e}")
+            # The snapshot is the only copy left, keep it complete
+            self.save_current(state)
+            return
+
+        self._turns_since_snapshot += 1
+        if self._turns_since_snapshot >= self.SNAPSHOT_INTERVAL:
+            self.save_current(state)
+
+    @staticmethod
+    def _write_atomic(filepath: Path, data: Dict[str, Any]):
+        """Write JSON to a temp file and rename it over filepath"""
+        # No fsync: the chat can always be continued from the last snapshot
+        jsonutil.write_atomic(filepath, jsonutil.dumps(data))
+
+    def _open_log(self):
+        """Open the message log for appending, dropping a torn tail first"""
+        self._message_log = open(self.message_log_file, "ab")
+        if self._log_end is not None:
+            self._message_log.truncate(self._log_end)
+            self._message_log.seek(0, os.SEEK_END)
+            self._log_end = None
+
+    def _log_size(self) -> int:
+        """Get the current size of the message log in bytes"""
+        if self._message_log is not None:
+            return self._message_log.tell()
+        if self._log_end is not None:
+            return self._log_end
+        try:
+            return self.message_log_file.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _remove_log(self):
+        """Close and delete the message log"""
+        if self._message_log is not None:
+            self._message_log.close()
+            self._message_log = None
+        self.message_log_file.unlink(missing_ok=True)
+        self._turns_since_snapshot = 0
+        self._log_end = None
+
     def create_new(self, prompt_name: str, model: str) -> ConversationState:
         """Create a new conversation state"""
-        now = datetime.now().isoformat()
-        return ConversationState(
+        # A new conversation starts a new message log
+        self._remove_log()
+
+        now = datetime.now()
+        state = ConversationState(
             active=True,
             prompt_name=prompt_name,
             model=model,
-            created_at=now,
-            last_activity=now,
-            messages=[],
+            created_at=now.isoformat(),
+            last_activity_ts=now.timestamp(),
         )
 
+        # Snapshot right away: later turns only go to the log, which is useless
+        # without a current.json, and a stale one would point into the new log
+        self.save_current(state)
+        return state
+
     def archive_current(self) -> bool:
         """Archive current conversation to history"""
         if not self.current_state_file.exists():
@@ -144,11 +330,11 @@ class StateManager:
             state.active = False
 
             # Save to history
-            with open(archive_file, "w") as f:
-                json.dump(state.to_dict(), f, indent=2)
+            self._write_atomic(archive_file, state.to_dict())
 
             # Remove current state file
             self.current_state_file.unlink()
+            self._remove_log()
 
             return True
 
@@ -163,6 +349,7 @@ class StateManager:
 
         try:
             self.current_state_file.unlink()
+            self._remove_log()
             return True
         except OSError as e:
             print(f"Error deleting state: {e}")
@@ -183,10 +370,9 @@ class StateManager:
             return None
 
         try:
-            with open(history_file, "r") as f:
-                data = json.load(f)
-                return ConversationState.from_dict(data)
-        except (json.JSONDecodeError, IOError) as e:
+            data = jsonutil.loads(history_file.read_bytes())
+            return ConversationState.from_dict(data)
+        except (jsonutil.JSONDecodeError, IOError) as e:
             print(f"Error loading history: {e}")
             return None
 
@@ -196,6 +382,7 @@ class StateManager:
             # Delete current state
             if self.current_state_file.exists():
                 self.current_state_file.unlink()
+            self._remove_log()
 
             # Delete all history
             for history_file in self.list_history():
@@ -214,7 +401,7 @@ class StateManager:
             return {"active": False, "message": "No active conversation"}
 
         created = datetime.fromisoformat(state.created_at)
-        last_activity = datetime.fromisoformat(state.last_activity)
+        last_activity = datetime.fromtimestamp(state.last_activity_ts)
 
         return {
             "active": True,
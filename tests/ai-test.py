@@ -5,33 +5,12 @@ Press Enter to read clipboard and send to AI
 Type 'quit' to exit
 """
 
-import subprocess
 import sys
 import os
 from google import genai
 from google.genai import types
 
-
-def get_clipboard():
-    """Get current clipboard content using wl-paste"""
-    try:
-        result = subprocess.run(
-            ["wl-paste"], capture_output=True, text=True, check=True
-        )
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        print(f"Error reading clipboard: {e}", file=sys.stderr)
-        return None
-
-
-def set_clipboard(text):
-    """Set clipboard content using wl-copy"""
-    try:
-        subprocess.run(["wl-copy"], input=text, text=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        print(f"Error setting clipboard: {e}", file=sys.stderr)
-        return False
+from wl_clipboard import ClipboardWatcher, set_clipboard
 
 
 def get_api_key():
@@ -78,6 +57,21 @@ def main():
     print("3. AI response will be copied to clipboard")
     print("4. Type 'quit' and press Enter to exit\n")
 
+    # One wl-paste for the whole session instead of one per Enter
+    try:
+        watcher = ClipboardWatcher()
+    except FileNotFoundError:
+        print("✗ wl-paste not found. Make sure wl-clipboard is installed.")
+        return 1
+
+    try:
+        return chat_loop(chat, watcher)
+    finally:
+        watcher.close()
+
+
+def chat_loop(chat, watcher):
+    """Send the clipboard to the chat each time Enter is pressed"""
     message_count = 0
 
     while True:
@@ -91,7 +85,7 @@ def main():
             break
 
         # Read clipboard
-        clipboard_content = get_clipboard()
+        clipboard_content = (watcher.read() or "").strip()
         if not clipboard_content:
             print("✗ Clipboard is empty or couldn't be read\n")
             continue
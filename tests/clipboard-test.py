@@ -3,42 +3,9 @@
 Simple test to verify clipboard operations work on Wayland
 """
 
-import subprocess
 import sys
 
-
-def get_clipboard():
-    """Get current clipboard content using wl-paste"""
-    try:
-        result = subprocess.run(
-            ["wl-paste"], capture_output=True, text=True, check=True
-        )
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"Error reading clipboard: {e}", file=sys.stderr)
-        return None
-    except FileNotFoundError:
-        print(
-            "Error: wl-paste not found. Make sure wl-clipboard is installed.",
-            file=sys.stderr,
-        )
-        return None
-
-
-def set_clipboard(text):
-    """Set clipboard content using wl-copy"""
-    try:
-        subprocess.run(["wl-copy"], input=text, text=True, check=True)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error setting clipboard: {e}", file=sys.stderr)
-        return False
-    except FileNotFoundError:
-        print(
-            "Error: wl-copy not found. Make sure wl-clipboard is installed.",
-            file=sys.stderr,
-        )
-        return False
+from wl_clipboard import get_clipboard, set_clipboard
 
 
 def main():
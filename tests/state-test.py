@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test that a message log torn by a crash resumes cleanly
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from state import StateManager  # noqa: E402
+
+
+def add_turn(state_manager, state, user, model):
+    """Record one user/model turn the way the daemon does"""
+    user_message = state.add_message("user", user)
+    model_message = state.add_message("model", model)
+    state_manager.append_messages(state, user_message, model_message)
+
+
+def main():
+    print("=== Torn Message Log Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_manager = StateManager(Path(tmp))
+        state = state_manager.create_new("default", "gemini-2.5-flash")
+        state_manager.save_current(state)
+        add_turn(state_manager, state, "a", "b")
+        add_turn(state_manager, state, "c", "d")
+
+        # Crash halfway through writing the second turn's model line
+        log = state_manager.message_log_file
+        log.write_bytes(log.read_bytes()[:-10])
+
+        # Restart: resume, then carry on with a new turn
+        state_manager = StateManager(Path(tmp))
+        state = state_manager.load_current()
+        print(f"Resumed: {state.contents}")
+        add_turn(state_manager, state, "e", "f")
+
+        # Restart again, the new turn must survive intact
+        state = StateManager(Path(tmp)).load_current()
+        print(f"Reloaded: {state.contents}")
+
+        if state.contents != ["a", "b", "e", "f"]:
+            print("✗ Torn tail corrupted the following turn")
+            return 1
+        if state.roles != ["user", "model", "user", "model"]:
+            print("✗ Roles no longer alternate")
+            return 1
+
+    print("✓ Torn tail dropped, later turns intact")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Wayland clipboard helpers shared by the test scripts
+"""
+
+import os
+import select
+import subprocess
+import sys
+
+# Same framing as the daemon's watcher: one NUL terminated selection per change
+WL_PASTE_WATCH_ARGV = [
+    "wl-paste",
+    "--no-newline",
+    "--type",
+    "text",
+    "--watch",
+    "sh",
+    "-c",
+    'cat; printf "\\0"',
+]
+
+
+def get_clipboard():
+    """Get current clipboard content using wl-paste"""
+    try:
+        result = subprocess.run(
+            ["wl-paste"], capture_output=True, text=True, check=True
+        )
+        return result.stdout
+    except subprocess.CalledProcessError as e:
+        print(f"Error reading clipboard: {e}", file=sys.stderr)
+        return None
+    except FileNotFoundError:
+        print(
+            "Error: wl-paste not found. Make sure wl-clipboard is installed.",
+            file=sys.stderr,
+        )
+        return None
+
+
+def set_clipboard(text):
+    """Set clipboard content using wl-copy"""
+    # wl-copy serves the selection until something else takes it, so it can't
+    # be kept around and reused; one short-lived process per copy it is
+    try:
+        subprocess.run(["wl-copy"], input=text, text=True, check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"Error setting clipboard: {e}", file=sys.stderr)
+        return False
+    except FileNotFoundError:
+        print(
+            "Error: wl-copy not found. Make sure wl-clipboard is installed.",
+            file=sys.stderr,
+        )
+        return False
+
+
+class ClipboardWatcher:
+    """One wl-paste --watch process that tracks the latest selection"""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            WL_PASTE_WATCH_ARGV,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.latest = None
+        self.pending = b""
+        # Set once wl-paste exits (e.g. compositors without wlr-data-control)
+        self.dead = False
+
+    def read(self, wait: float = 0.5):
+        """Get the latest selection, waiting briefly if none has arrived yet"""
+        if self.dead:
+            return get_clipboard()
+
+        fd = self.process.stdout.fileno()
+        timeout = wait if self.latest is None else 0
+
+        while select.select([fd], [], [], timeout)[0]:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                # Watcher gone, read the clipboard the one-shot way from now on
+                self.dead = True
+                self.process.wait()
+                return get_clipboard()
+            self.pending += chunk
+            if b"\0" in self.pending:
+                *selections, self.pending = self.pending.split(b"\0")
+                self.latest = selections[-1].decode("utf-8", errors="replace")
+                timeout = 0
+
+        if self.latest is None:
+            # Nothing from the watcher yet (or it exited without closing)
+            if self.process.poll() is not None:
+                self.dead = True
+            return get_clipboard()
+        return self.latest
+
+    def close(self):
+        """Stop the watcher process"""
+        self.process.terminate()
+        self.process.wait()